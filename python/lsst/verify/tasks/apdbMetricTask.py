@@ -23,6 +23,8 @@ __all__ = ["ApdbMetricTask", "ApdbMetricConfig", "ConfigApdbLoader",
            "DirectApdbLoader", "ApdbMetricConnections"]
 
 import abc
+import collections
+import io
 import traceback
 
 from lsst.pex.config import Config, ConfigurableField, ConfigurableInstance, \
@@ -34,6 +36,42 @@ from lsst.verify.tasks import MetricTask, MetricConfig, MetricConnections, \
     MetricComputationError
 
 
+def _isMultiChoice(field):
+    """Test whether a choice field allows more than one selection.
+
+    Parameters
+    ----------
+    field : `lsst.pex.config.ConfigChoiceField.instanceDictClass`
+        The value of a `lsst.pex.config.ConfigChoiceField` or
+        `lsst.pex.config.RegistryField`.
+
+    Returns
+    -------
+    multi : `bool`
+        `True` if ``field`` allows multiple selections, `False` otherwise.
+
+    Notes
+    -----
+    pex.config has no public way to ask this: ``field.names`` raises
+    `lsst.pex.config.FieldValidationError` on single-selection fields, and
+    can't be tested with `hasattr` because of non-standard getattr. This
+    function reads the ``multi`` flag of the field that created ``field``,
+    which is stored in the private ``_field`` attribute. If that attribute
+    is missing or is not a `~lsst.pex.config.ConfigChoiceField`, it falls
+    back to probing ``field.names``.
+    """
+    descriptor = getattr(field, "_field", None)
+    if isinstance(descriptor, ConfigChoiceField):
+        return descriptor.multi
+
+    try:
+        field.names
+    except FieldValidationError:
+        return False
+    else:
+        return True
+
+
 class ConfigApdbLoader(Task):
     """A Task that takes a science task config and returns the corresponding
     Apdb object.
@@ -47,8 +85,51 @@ class ConfigApdbLoader(Task):
     _DefaultName = "configApdb"
     ConfigClass = Config
 
+    # Maximum number of database handles kept open by _makeApdb
+    _apdbCacheSize = 4
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self._apdbCache = collections.OrderedDict()
+
+    def _makeApdb(self, target, config):
+        """Create a database handle, reusing one for an equal config.
+
+        Parameters
+        ----------
+        target : callable
+            The class or factory that creates the handle. It must take the
+            database config as its ``config`` keyword argument.
+        config : `lsst.dax.apdb.ApdbConfig`
+            The config of the database.
+
+        Returns
+        -------
+        apdb : `lsst.dax.apdb.Apdb`-like
+            A `lsst.dax.apdb.Apdb` object or a drop-in replacement.
+
+        Notes
+        -----
+        Handles are cached by the value of ``config`` rather than its
+        identity, so configs loaded separately but with equal values share
+        one handle. Each handle is built from a private copy of ``config``,
+        so later changes to ``config`` do not affect the cached handle. Only
+        the most recently used handles are kept.
+        """
+        stream = io.StringIO()
+        config.saveToStream(stream)
+        serialized = stream.getvalue()
+
+        key = (target, type(config), serialized)
+        if key in self._apdbCache:
+            self._apdbCache.move_to_end(key)
+        else:
+            privateConfig = type(config)()
+            privateConfig.loadFromStream(serialized)
+            self._apdbCache[key] = target(config=privateConfig)
+            if len(self._apdbCache) > self._apdbCacheSize:
+                self._apdbCache.popitem(last=False)
+        return self._apdbCache[key]
 
     def _getApdb(self, config):
         """Extract an Apdb object from an arbitrary task config.
@@ -68,7 +149,7 @@ class ConfigApdbLoader(Task):
         if config is None:
             return None
         if isinstance(config, ApdbConfig):
-            return Apdb(config)
+            return self._makeApdb(Apdb, config)
 
         for field in config.values():
             if isinstance(field, ConfigurableInstance):
@@ -76,13 +157,10 @@ class ConfigApdbLoader(Task):
                 if result:
                     return result
             elif isinstance(field, ConfigChoiceField.instanceDictClass):
-                try:
-                    # can't test with hasattr because of non-standard getattr
-                    field.names
-                except FieldValidationError:
-                    result = self._getApdb(field.active)
-                else:
+                if _isMultiChoice(field):
                     result = self._getApdbFromConfigIterable(field.active)
+                else:
+                    result = self._getApdb(field.active)
                 if result:
                     return result
             elif isinstance(field, ConfigDictField.DictClass):
@@ -114,7 +192,7 @@ class ConfigApdbLoader(Task):
             return None
 
         if configurable.ConfigClass == ApdbConfig:
-            return configurable.apply()
+            return self._makeApdb(configurable.target, configurable.value)
         else:
             return self._getApdb(configurable.value)
 
@@ -156,6 +234,14 @@ class ConfigApdbLoader(Task):
             ``apdb``
                 A database configured the same way as in ``config``, if one
                 exists (`lsst.dax.apdb.Apdb` or `None`).
+
+        Notes
+        -----
+        Creating a database handle opens a connection, so calls whose
+        database configs have equal values may return the same handle. The
+        loader keeps the most recently used handles, and their connections,
+        open for its whole lifetime. Callers must not close or modify the
+        returned handle.
         """
         return Struct(apdb=self._getApdb(config))
 
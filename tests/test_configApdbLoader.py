@@ -19,6 +19,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import os
+import tempfile
 import unittest
 
 import lsst.utils.tests
@@ -192,6 +194,64 @@ class ConfigApdbLoaderTestSuite(lsst.utils.tests.TestCase):
         result = self.task.run(config)
         self.assertIsInstance(result.apdb, Apdb)
 
+    def testCachedApdb(self):
+        config = self._dummyApdbConfig()
+        result1 = self.task.run(config)
+        result2 = self.task.run(config)
+        self.assertIsInstance(result1.apdb, Apdb)
+        self.assertIs(result1.apdb, result2.apdb)
+
+        config.isolation_level = "READ_COMMITTED"
+        result3 = self.task.run(config)
+        self.assertIsInstance(result3.apdb, Apdb)
+        self.assertIsNot(result1.apdb, result3.apdb)
+
+    def testEqualConfigsShareApdb(self):
+        result1 = self.task.run(self._dummyApdbConfig())
+        result2 = self.task.run(self._dummyApdbConfig())
+        self.assertIsInstance(result1.apdb, Apdb)
+        self.assertIs(result1.apdb, result2.apdb)
+
+    def testEqualNestedConfigsShareApdb(self):
+        class TestConfig(Config):
+            field = ConfigurableField(target=Apdb, ConfigClass=ApdbConfig,
+                                      doc="")
+
+        config1 = TestConfig()
+        config1.field = self._dummyApdbConfig()
+        config2 = TestConfig()
+        config2.field = self._dummyApdbConfig()
+        result1 = self.task.run(config1)
+        result2 = self.task.run(config2)
+        self.assertIsInstance(result1.apdb, Apdb)
+        self.assertIs(result1.apdb, result2.apdb)
+
+    def testCachedApdbUnaffectedByChanges(self):
+        config = self._dummyApdbConfig()
+        self.task.run(config)
+        config.isolation_level = "READ_COMMITTED"
+
+        result = self.task.run(self._dummyApdbConfig())
+        self.assertIsInstance(result.apdb, Apdb)
+        self.assertEqual(result.apdb.config.isolation_level,
+                         "READ_UNCOMMITTED")
+
+    def testCacheEviction(self):
+        with tempfile.TemporaryDirectory() as tempDir:
+            configs = []
+            for i in range(ConfigApdbLoader._apdbCacheSize + 1):
+                config = self._dummyApdbConfig()
+                config.db_url = "sqlite:///" + os.path.join(
+                    tempDir, "apdb%d.db" % i)
+                configs.append(config)
+
+            result1 = self.task.run(configs[0])
+            for config in configs[1:]:
+                self.assertIsNot(self.task.run(config).apdb, result1.apdb)
+
+            result2 = self.task.run(configs[0])
+            self.assertIsInstance(result2.apdb, Apdb)
+            self.assertIsNot(result1.apdb, result2.apdb)
 
 class MemoryTester(lsst.utils.tests.MemoryTestCase):
     pass